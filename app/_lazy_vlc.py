@@ -0,0 +1,11 @@
+# app/_lazy_vlc.py
+# Stand-in for the python-vlc module that defers the real import (and loading libvlc)
+# until one of its attributes is first used, e.g. vlc.Instance in BasePlaybackManager.
+# Code that only touches settings or playlists never pays that cost.
+
+
+def __getattr__(name):
+    import vlc as _vlc  # Raises ImportError if python-vlc is not installed
+    # Copy the public names over so later lookups no longer go through __getattr__
+    globals().update({key: value for key, value in vars(_vlc).items() if not key.startswith('__')})
+    return getattr(_vlc, name)
@@ -1,4 +1,38 @@
-from PyQt6.QtCore import QSettings, QVariant
+from PyQt6.QtCore import QSettings, QVariant, QTimer, QRunnable, QThreadPool
+
+
+def _to_bool(value):
+    if isinstance(value, str):
+        return value.lower() == 'true'
+    return bool(value)
+
+
+# Type of the default value -> function converting a raw QSettings value to that type
+_COERCE = {bool: _to_bool, int: int, float: float}
+
+
+def _write_values(settings, values):
+    """Applies a {key: value} batch to settings (None removes the key) and syncs once."""
+    for key, value in values.items():
+        if value is None:
+            settings.remove(key)  # Remove if value is None
+        else:
+            settings.setValue(key, value)
+    settings.sync()  # Ensure changes are written
+
+
+class _SettingsWriter(QRunnable):
+    """Writes a batch of settings from a pool thread, through its own QSettings object."""
+
+    def __init__(self, file_name, settings_format, values):
+        super().__init__()
+        self._file_name = file_name
+        self._format = settings_format
+        self._values = values
+
+    def run(self):
+        # QSettings objects must not be shared between threads, so open the same store afresh
+        _write_values(QSettings(self._file_name, self._format), self._values)
 
 
 class SettingsManager:
@@ -13,6 +47,24 @@ class SettingsManager:
                                   QSettings.Scope.UserScope,
                                   organization_name,
                                   application_name)
+
+        # Pending writes are buffered here and flushed to disk in one go, so a burst
+        # of set_setting() calls (slider drags, geometry saves) costs a single sync().
+        self._dirty = {}
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)  # ms, coalescing window
+        self._flush_timer.timeout.connect(self._flush)
+        # Upper bound on how long a write may stay buffered while the window keeps restarting.
+        self._max_delay_timer = QTimer()
+        self._max_delay_timer.setSingleShot(True)
+        self._max_delay_timer.setInterval(2000)  # ms
+        self._max_delay_timer.timeout.connect(self._flush)
+
+        # Values already read or written this session; avoids re-querying QSettings.
+        self._cache = {}
+        self._kb_cache = None  # Keyboard bindings dict, built on first request
+
         self._init_defaults()
 
     def _init_defaults(self):
@@ -39,57 +91,98 @@ class SettingsManager:
                 # else: self.settings.remove(key) # Ensure it's not there
 
     def set_setting(self, key, value):
-        """Saves a setting."""
+        """Saves a setting. The write is buffered and flushed after a short delay."""
         if value is None:
-            self.settings.remove(key)  # Remove if value is None
+            self._cache.pop(key, None)
         else:
-            self.settings.setValue(key, value)
-        self.settings.sync()  # Ensure changes are written
+            self._cache[key] = value
+        self._dirty[key] = value  # None means remove
+        self._flush_timer.start()  # (Re)start the coalescing window
+        if not self._max_delay_timer.isActive():
+            self._max_delay_timer.start()
+
+    def _flush(self):
+        """Writes all buffered settings and syncs once."""
+        self._flush_timer.stop()
+        self._max_delay_timer.stop()
+        if not self._dirty:
+            return
+        _write_values(self.settings, self._dirty)
+        self._dirty.clear()
+
+    def flush_now(self):
+        """Immediately writes any buffered settings to disk (e.g. on shutdown)."""
+        self._flush()
+
+    def flush_in_background(self):
+        """Writes any buffered settings on a QThreadPool.globalInstance() worker and returns at once.
+
+        Callers that are about to exit should waitForDone() on the global pool.
+        """
+        self._flush_timer.stop()
+        self._max_delay_timer.stop()
+        if not self._dirty:
+            return
+        values, self._dirty = self._dirty, {}
+        QThreadPool.globalInstance().start(
+            _SettingsWriter(self.settings.fileName(), self.settings.format(), values))
 
     def get_setting(self, key, default_value=None):
         """Retrieves a setting."""
+        if key in self._cache:
+            return self._cache[key]
+        if key in self._dirty:
+            # Pending removal that hasn't been flushed yet
+            return default_value
+
         if not self.settings.contains(key) and default_value is not None:
             # If key does not exist, and a default is provided,
             # optionally store this default for next time.
             # self.settings.setValue(key, default_value)
             return default_value
 
-        value = self.settings.value(key, defaultValue=default_value)
+        value = self._coerce(self.settings.value(key, defaultValue=default_value), default_value)
+        if value is not None:  # Don't pin a missing key to whatever default this caller passed
+            self._cache[key] = value
+        return value
 
+    @staticmethod
+    def _coerce(value, default_value):
+        """Converts a raw QSettings value to the type of default_value."""
         # QSettings might return strings for numbers/bools with IniFormat on some platforms
         # or if the stored type is ambiguous. Try to convert common types.
-        if isinstance(default_value, bool):
-            if isinstance(value, str):
-                return value.lower() == 'true'
-            return bool(value)
-        if isinstance(default_value, int):
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return default_value
-        if isinstance(default_value, float):
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default_value
-
-        return value
+        fn = _COERCE.get(type(default_value))
+        if fn is None:
+            return value
+        try:
+            return fn(value)
+        except (ValueError, TypeError):
+            return default_value
 
     def get_keyboard_bindings(self):
         """Retrieves all keyboard bindings as a dictionary."""
-        bindings = {}
-        self.settings.beginGroup("keyboardBindings")
-        for key in self.settings.childKeys():
-            bindings[key] = self.settings.value(key)
-        self.settings.endGroup()
-        return bindings
+        if self._kb_cache is None:
+            prefix = "keyboardBindings/"
+            bindings = {key[len(prefix):]: self.settings.value(key)
+                        for key in self.settings.allKeys() if key.startswith(prefix)}
+            # Bindings set since the last flush aren't in QSettings yet
+            for key, value in self._dirty.items():
+                if key.startswith(prefix):
+                    if value is None:
+                        bindings.pop(key[len(prefix):], None)
+                    else:
+                        bindings[key[len(prefix):]] = value
+            self._kb_cache = bindings
+        return dict(self._kb_cache)  # Copy so callers can't mutate the cache
 
     def set_keyboard_binding(self, action_name, key_sequence):
-        """Sets a specific keyboard binding."""
-        self.settings.beginGroup("keyboardBindings")
-        self.settings.setValue(action_name, key_sequence)
-        self.settings.endGroup()
-        self.settings.sync()
+        """Sets a specific keyboard binding. Written to disk with the next settings flush."""
+        self.set_setting(f"keyboardBindings/{action_name}", key_sequence)
+        if self._kb_cache is not None:
+            if key_sequence is None:
+                self._kb_cache.pop(action_name, None)
+            else:
+                self._kb_cache[action_name] = key_sequence
 
 
 if __name__ == '__main__':
@@ -113,6 +206,7 @@ if __name__ == '__main__':
 
     sm.set_keyboard_binding("playPause", "Ctrl+P")
     print(f"Bindings: {sm.get_keyboard_bindings()}")
+    sm.flush_now()
 
     # Clean up test settings (optional)
     # sm.settings.clear()
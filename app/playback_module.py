@@ -1,12 +1,30 @@
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox  # For error display
 
-try:
-    import vlc
-except ImportError:
-    vlc = None
-    print("ERROR: python-vlc or VLC library not found. Playback will be disabled.")
-    # Consider raising an exception or having a more robust fallback if VLC is critical
+from . import _lazy_vlc as vlc  # python-vlc is imported on first use
+
+_vlc_instance = None  # libvlc instance shared by all playback managers
+
+
+def _get_vlc_instance():
+    """Returns the shared vlc.Instance, creating it on first use."""
+    global _vlc_instance
+    if _vlc_instance is None:
+        # Forcing some options for stability or features if needed
+        # Example: vlc_args = ['--no-xlib'] # if on Linux and facing issues
+        # _vlc_instance = vlc.Instance(vlc_args)
+        _vlc_instance = vlc.Instance()
+    return _vlc_instance
+
+
+def shutdown_vlc():
+    """Releases the shared vlc.Instance. Call on app exit, after all players are released."""
+    global _vlc_instance
+    if _vlc_instance is not None:
+        _vlc_instance.release()
+        _vlc_instance = None
 
 
 class BasePlaybackManager(QObject):
@@ -19,19 +37,27 @@ class BasePlaybackManager(QObject):
 
     def __init__(self, hwnd=None):  # hwnd for video output if applicable
         super().__init__()
-        if not vlc:
+        try:
+            # One libvlc instance serves every MediaPlayer; the first call imports python-vlc
+            self.instance = _get_vlc_instance()
+        except ImportError:
+            print("ERROR: python-vlc or VLC library not found. Playback will be disabled.")
+            # Consider raising an exception or having a more robust fallback if VLC is critical
             self.instance = None
             self.player = None
             self.error_occurred.emit("VLC is not available.")
             return
 
-        # Forcing some options for stability or features if needed
-        # Example: vlc_args = ['--no-xlib'] # if on Linux and facing issues
-        # self.instance = vlc.Instance(vlc_args)
-        self.instance = vlc.Instance()
         self.player = self.instance.media_player_new()
         self.current_media_path = None
         self.is_video_output_set = False
+        # VLC reports position changes far more often than the UI needs; rate-limit the signal
+        self._last_pos_emit_ms = 0
+        self._pos_min_interval_ms = 80
+        # Player state as last reported by VLC events; None means unknown, so ask libvlc
+        self._cached_length = None
+        self._cached_seekable = None
+        self._cached_playing = None
 
         if hwnd:
             self.set_video_output(hwnd)
@@ -43,27 +69,55 @@ class BasePlaybackManager(QObject):
         self.event_manager.event_attach(vlc.EventType.MediaPlayerEncounteredError, self._on_media_error)
         # MediaPlayerMediaChanged can be useful too
         self.event_manager.event_attach(vlc.EventType.MediaPlayerMediaChanged, self._on_media_changed)
+        # Keep cached player state current so getters don't have to call into libvlc
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerLengthChanged, self._on_length_changed)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerSeekableChanged, self._on_seekable_changed)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_playing_state_changed, True)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerPaused, self._on_playing_state_changed, False)
+        self.event_manager.event_attach(vlc.EventType.MediaPlayerStopped, self._on_playing_state_changed, False)
+
+    def _on_length_changed(self, event):
+        # VLC knows the length at this point, so report it right away
+        self._cached_length = event.u.new_length
+        self.media_duration_changed.emit(max(0, self._cached_length))
+
+    def _on_seekable_changed(self, event):
+        self._cached_seekable = bool(event.u.new_seekable)
+
+    def _on_playing_state_changed(self, event, playing):
+        self._cached_playing = playing
 
     def _on_media_changed(self, event):
         """Called when the media in the player changes."""
-        # This is a good place to fetch initial duration
-        # Use a short QTimer to allow media to fully load before getting duration
-        QTimer.singleShot(100, self._fetch_and_emit_duration)
+        self._cached_length = None
+        self._cached_seekable = None
+        self._cached_playing = None
+        # Unknown until _on_length_changed reports it (streams and images may never do so);
+        # don't leave listeners scaling positions by the previous item's length
+        self.media_duration_changed.emit(0)
 
     def _fetch_and_emit_duration(self):
+        """Queries the current length from VLC and emits it (explicit refresh)."""
         if self.player:
             duration = self.player.get_length()  # in ms
             self.media_duration_changed.emit(duration if duration > 0 else 0)
 
     def _on_media_end_reached(self, event):
+        self._cached_playing = False
         self.media_ended.emit()
 
     def _on_media_position_changed(self, event):
-        if self.player and self.player.is_playing():  # Only emit if actually playing
+        # Runs on VLC's event thread; drop updates that arrive within the minimum interval
+        now_ms = time.monotonic_ns() // 1_000_000
+        if now_ms - self._last_pos_emit_ms < self._pos_min_interval_ms:
+            return
+        if self.player and self.is_playing():  # Only emit if actually playing
+            self._last_pos_emit_ms = now_ms
             position = self.player.get_position()  # float 0.0 to 1.0
             self.media_position_changed.emit(position)
 
     def _on_media_error(self, event):
+        self._cached_playing = None  # The player is in the Error state now; ask libvlc again
         # VLC errors are often not very descriptive by default.
         # For more details, you might need to check VLC logs or use more advanced error handling.
         error_msg = "An error occurred in VLC media player."
@@ -88,7 +142,7 @@ class BasePlaybackManager(QObject):
 
             self.player.set_media(media)
             self.current_media_path = file_path
-            # Duration will be emitted by _on_media_changed -> _fetch_and_emit_duration
+            # Duration will be emitted by _on_length_changed
             return True
         except Exception as e:
             err_msg = f"Failed to load media '{file_path}': {e}"
@@ -99,6 +153,7 @@ class BasePlaybackManager(QObject):
 
     def play(self):
         if self.player and self.current_media_path:
+            self._cached_playing = None  # Unknown until VLC reports the new state
             if self.player.play() == -1:  # Play returns -1 on error
                 self.error_occurred.emit(f"Could not start playback for {self.current_media_path}.")
                 return False
@@ -109,16 +164,19 @@ class BasePlaybackManager(QObject):
 
     def pause(self):
         if self.player:
+            self._cached_playing = None
             self.player.pause()  # This is a toggle: pause/resume
 
     def resume(self):
-        if self.player and not self.player.is_playing():
+        if self.player and not self.is_playing():
             # Ensure it's actually paused and not stopped/ended
             if self.player.get_state() == vlc.State.Paused:
+                self._cached_playing = None
                 self.player.pause()  # Toggles back to play
 
     def stop(self):
         if self.player:
+            self._cached_playing = None
             self.player.stop()
             # self.current_media_path = None # Or keep it to allow replay
 
@@ -132,7 +190,7 @@ class BasePlaybackManager(QObject):
         return 0
 
     def set_position(self, position):  # Position 0.0 to 1.0
-        if self.player and self.player.is_seekable():
+        if self.player and self.can_seek():
             self.player.set_position(position)
 
     def get_position(self):
@@ -140,14 +198,23 @@ class BasePlaybackManager(QObject):
             return self.player.get_position()
         return 0.0
 
+    def get_time(self):  # Current playback time in ms
+        if self.player:
+            return self.player.get_time()
+        return 0
+
     def get_duration(self):  # in ms
         if self.player:
+            if self._cached_length is not None:
+                return self._cached_length
             return self.player.get_length()
         return 0
 
     def is_playing(self):
         if self.player:
-            return self.player.is_playing()
+            if self._cached_playing is not None:
+                return self._cached_playing
+            return bool(self.player.is_playing())
         return False
 
     def get_player_state(self):
@@ -157,7 +224,9 @@ class BasePlaybackManager(QObject):
 
     def can_seek(self):
         if self.player:
-            return self.player.is_seekable()
+            if self._cached_seekable is not None:
+                return self._cached_seekable
+            return bool(self.player.is_seekable())
         return False
 
     def get_current_media_path(self):
@@ -181,9 +250,7 @@ class BasePlaybackManager(QObject):
             self.player.stop()
             self.player.release()
             self.player = None
-        if self.instance:
-            self.instance.release()
-            self.instance = None
+        self.instance = None  # Shared instance; released by shutdown_vlc()
         print(f"{self.__class__.__name__} resources released.")
 
 
@@ -246,11 +313,11 @@ class BackgroundAudioManager(BasePlaybackManager):
         """Override to handle looping for background audio."""
         if self._loop and self.current_media_path:
             print("Background audio looping...")
-            # Re-load and play the same media.
-            # Need to be careful to avoid deep recursion or rapid events if media is very short.
-            # A small delay might be good.
-            # self.play() # This might just replay from end. Better to seek to start or reload.
-            self.player.set_media(self.instance.media_new(self.current_media_path))  # Re-set media
+            # Restart the media that is already set on the player instead of creating
+            # a new vlc.Media each loop, which would re-open and re-parse the file.
+            # ':input-repeat' isn't used because it can't be undone when looping is
+            # switched off while the track is playing.
+            self.player.stop()
             self.play()
         else:
             super()._on_media_end_reached(event)  # Emit signal if not looping
@@ -1,23 +1,61 @@
+import functools
+import hashlib
 import json
 import os
-from PyQt6.QtCore import QObject, pyqtSignal, QFileInfo
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from .utils import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS, AUDIO_EXTENSIONS
+
+try:
+    import orjson  # Much faster JSON encoding/decoding when available
+except ImportError:
+    orjson = None
+
+# Extension (lower case, no dot) -> media type, used by MediaItem._guess_media_type
+_EXT_TO_TYPE = {
+    **{ext: 'image' for ext in IMAGE_EXTENSIONS},
+    **{ext: 'video' for ext in VIDEO_EXTENSIONS},
+    **{ext: 'audio' for ext in AUDIO_EXTENSIONS},
+}
+
+@functools.lru_cache(maxsize=4096)
+def _split(path):
+    """Returns (file name, lower-case extension without dot) for a path, without touching disk."""
+    base = os.path.basename(path)
+    return base, os.path.splitext(base)[1].lstrip('.').lower()
+
+
+_STAT_WORKERS = 8  # Threads used to check file existence for large batches
+
+
+def _file_exists(path):
+    return bool(path) and os.path.exists(path)
+
+
+def _paths_exist(paths):
+    """Checks existence of many paths at once, stat'ing them concurrently for big batches."""
+    if len(paths) < _STAT_WORKERS:
+        return [_file_exists(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as executor:
+        return list(executor.map(_file_exists, paths))
 
 
 class MediaItem:
     """Represents a single item in the playlist."""
 
+    # No per-instance __dict__: keeps large playlists compact in memory
+    __slots__ = ('file_path', '_exists', 'media_type', 'display_name', 'duration',
+                 'loop', 'start_point', 'end_point')
+
     def __init__(self, file_path, media_type=None, display_name=None, duration=None,
                  loop=False, start_point=None, end_point=None):
         self.file_path = file_path
-        self.file_info = QFileInfo(file_path)
-
-        if not self.file_info.exists():
-            # Consider raising an error or handling this more gracefully
-            print(f"Warning: File does not exist: {file_path}")
-            # self.file_path = None # Or mark as invalid
+        self._exists = None  # Result of validate(), filled lazily or by batch checks
 
         self.media_type = media_type if media_type else self._guess_media_type()
-        self.display_name = display_name if display_name else self.file_info.fileName()
+        self.display_name = display_name if display_name else self.basename
 
         # Duration: for images, this is display duration. For video/audio, it's actual length.
         # Actual length for video/audio will be fetched by VLC.
@@ -30,14 +68,23 @@ class MediaItem:
     def _guess_media_type(self):
         """Guesses media type based on file extension."""
         if not self.file_path: return "unknown"
-        ext = self.file_info.suffix().lower()
-        if ext in ['jpg', 'jpeg', 'png', 'bmp', 'gif']:
-            return 'image'
-        elif ext in ['mp4', 'avi', 'wmv', 'mkv', 'mov', 'flv']:
-            return 'video'
-        elif ext in ['mp3', 'wav', 'aac', 'ogg', 'flac', 'm4a']:
-            return 'audio'
-        return 'unknown'
+        return _EXT_TO_TYPE.get(self.extension, 'unknown')
+
+    @property
+    def basename(self):
+        """File name part of file_path."""
+        return _split(self.file_path)[0] if self.file_path else ""
+
+    @property
+    def extension(self):
+        """Lower-case file extension without the leading dot."""
+        return _split(self.file_path)[1] if self.file_path else ""
+
+    def validate(self):
+        """Returns True if the file exists. The result is cached on the item."""
+        if self._exists is None:
+            self._exists = _file_exists(self.file_path)
+        return self._exists
 
     def to_dict(self):
         """Serializes MediaItem to a dictionary for JSON storage."""
@@ -70,36 +117,80 @@ class PlaylistManager(QObject):
     playlist_changed = pyqtSignal()  # Emitted when the playlist is modified
     current_item_changed = pyqtSignal(MediaItem, int)  # Emitted when current item changes
 
+    # Parsed item dicts of recently loaded playlists: file_path -> (content digest, items data).
+    # Shared across instances and kept in least-recently-used order.
+    _load_cache = {}
+    _LOAD_CACHE_SIZE = 16
+
     def __init__(self, settings_manager=None):  # settings_manager for default durations etc.
         super().__init__()
         self._items = []
         self.current_index = -1  # Index of the currently playing/selected item
         self.current_playlist_path = None
         self.settings_manager = settings_manager
+        self._batch_depth = 0  # > 0 while inside batch_changes()
+        self._batch_pending = False  # playlist_changed was suppressed during the batch
+
+    def _emit_playlist_changed(self):
+        """Emits playlist_changed now, or once at the end of the current batch."""
+        if self._batch_depth:
+            self._batch_pending = True
+        else:
+            self.playlist_changed.emit()
+
+    @contextmanager
+    def batch_changes(self):
+        """Groups several modifications so playlist_changed is emitted only once, on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending:
+                self._batch_pending = False
+                self._emit_playlist_changed()
 
     def add_item(self, file_path, media_type=None, position=-1):
         """Adds a new media item to the playlist."""
-        try:
-            # Default duration for images from settings
-            default_image_duration = 5000  # ms, or get from settings_manager
-            if self.settings_manager:
-                default_image_duration = self.settings_manager.get_setting("defaultImageDuration", 5000)
+        self.add_items([file_path], [media_type], position)
 
-            item = MediaItem(file_path, media_type)
-            if item.media_type == 'image' and item.duration is None:
-                item.duration = default_image_duration
+    def add_items(self, file_paths, media_types=None, position=-1):
+        """Adds several media items at once, emitting playlist_changed a single time.
 
-            if not item.file_path or not QFileInfo(item.file_path).exists():
-                print(f"Skipping invalid file: {file_path}")
-                return
+        Returns the number of items actually added.
+        """
+        if media_types is None:
+            media_types = [None] * len(file_paths)
 
-            if position == -1 or position >= len(self._items):
-                self._items.append(item)
-            else:
-                self._items.insert(position, item)
-            self.playlist_changed.emit()
-        except Exception as e:
-            print(f"Error adding item {file_path}: {e}")
+        # Default duration for images from settings
+        default_image_duration = 5000  # ms, or get from settings_manager
+        if self.settings_manager:
+            default_image_duration = self.settings_manager.get_setting("defaultImageDuration", 5000)
+
+        new_items = []
+        for file_path, media_type, found in zip(file_paths, media_types, _paths_exist(file_paths)):
+            if not found:
+                print(f"Skipping invalid file: {file_path}")
+                continue
+            try:
+                item = MediaItem(file_path, media_type)
+            except Exception as e:
+                print(f"Error adding item {file_path}: {e}")
+                continue
+            item._exists = True
+            if item.media_type == 'image' and item.duration is None:
+                item.duration = default_image_duration
+            new_items.append(item)
+
+        if not new_items:
+            return 0
+        if position == -1 or position >= len(self._items):
+            position = len(self._items)
+        self._items[position:position] = new_items
+        if 0 <= position <= self.current_index:
+            self.current_index += len(new_items)  # Keep pointing at the same item
+        self._emit_playlist_changed()
+        return len(new_items)
 
     def remove_item(self, index):
         """Removes an item from the playlist by index."""
@@ -112,7 +203,18 @@ class PlaylistManager(QObject):
                 elif self.current_index > index:
                     self.current_index -= 1
 
-            self.playlist_changed.emit()
+            self._emit_playlist_changed()
+
+    def remove_rows(self, rows):
+        """Removes the items at the given indexes, emitting playlist_changed a single time.
+
+        Invalid and duplicate indexes are ignored. Returns the number of items removed.
+        """
+        valid = sorted({row for row in rows if 0 <= row < len(self._items)}, reverse=True)
+        with self.batch_changes():
+            for row in valid:  # Highest first, so the remaining indexes stay valid
+                self.remove_item(row)
+        return len(valid)
 
     def move_item(self, old_index, new_index):
         """Moves an item within the playlist."""
@@ -126,7 +228,7 @@ class PlaylistManager(QObject):
                 self.current_index -= 1
             elif new_index <= self.current_index < old_index:
                 self.current_index += 1
-            self.playlist_changed.emit()
+            self._emit_playlist_changed()
 
     def get_items(self):
         """Returns the list of all media items."""
@@ -177,7 +279,7 @@ class PlaylistManager(QObject):
         self._items.clear()
         self.current_index = -1
         self.current_playlist_path = None
-        self.playlist_changed.emit()
+        self._emit_playlist_changed()
 
     def save_playlist(self, file_path):
         """Saves the current playlist to a JSON file."""
@@ -186,46 +288,109 @@ class PlaylistManager(QObject):
                 'default_image_duration': self.settings_manager.get_setting("defaultImageDuration",
                                                                             5000) if self.settings_manager else 5000
             },
-            'items': [item.to_dict() for item in self._items]
         }
+        to_dict = MediaItem.to_dict
+        playlist_data['items'] = [to_dict(item) for item in self._items]
+
+        if orjson:
+            payload = orjson.dumps(playlist_data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(playlist_data, indent=2, ensure_ascii=False).encode('utf-8')
+
+        # Write to a temp file and swap it in, so a crash mid-write can't corrupt the playlist
+        tmp_path = file_path + '.tmp'
         try:
-            with open(file_path, 'w') as f:
-                json.dump(playlist_data, f, indent=4)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, file_path)
             self.current_playlist_path = file_path
         except IOError as e:
             print(f"Error saving playlist to {file_path}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise
 
+    @classmethod
+    def _parse_playlist_items(cls, file_path, buf):
+        """Returns the item dicts of a playlist file, reusing the last parse if the content is unchanged."""
+        digest = hashlib.blake2b(buf, digest_size=16).digest()
+        cached = cls._load_cache.pop(file_path, None)
+        if cached is not None and cached[0] == digest:
+            cls._load_cache[file_path] = cached  # Re-insert as most recently used
+            return cached[1]
+
+        playlist_data = orjson.loads(buf) if orjson else json.loads(buf)
+        items_data = playlist_data.get('items', [])
+        cls._load_cache[file_path] = (digest, items_data)
+        if len(cls._load_cache) > cls._LOAD_CACHE_SIZE:
+            del cls._load_cache[next(iter(cls._load_cache))]  # Evict least recently used
+        return items_data
+
     def load_playlist(self, file_path):
         """Loads a playlist from a JSON file."""
         try:
-            with open(file_path, 'r') as f:
-                playlist_data = json.load(f)
-
-            self.clear_playlist()  # Clear existing before loading
-
-            # Load global settings from playlist if any
-            # Example: self.settings_manager.set_setting("defaultImageDuration", playlist_data.get('settings', {}).get('default_image_duration', 5000))
-
-            loaded_items = []
-            for item_data in playlist_data.get('items', []):
-                item = MediaItem.from_dict(item_data)
-                if item.file_path and QFileInfo(item.file_path).exists():
-                    loaded_items.append(item)
+            with open(file_path, 'rb') as f:
+                buf = f.read()
+            items_data = self._parse_playlist_items(file_path, buf)
+
+            with self.batch_changes():  # clear + load is a single change for listeners
+                self.clear_playlist()  # Clear existing before loading
+
+                # Load global settings from playlist if any
+                # Example: self.settings_manager.set_setting("defaultImageDuration", playlist_data.get('settings', {}).get('default_image_duration', 5000))
+
+                exists = _paths_exist([item_data.get('file_path') for item_data in items_data])
+
+                loaded_items = []
+                for item_data, found in zip(items_data, exists):
+                    if found:
+                        item = MediaItem.from_dict(item_data)
+                        item._exists = True
+                        loaded_items.append(item)
+                    else:
+                        print(f"Warning: File '{item_data.get('file_path')}' not found, skipped from playlist.")
+
+                self._items = loaded_items
+                if self._items:
+                    self.current_index = 0  # Select first item by default
                 else:
-                    print(f"Warning: File '{item_data.get('file_path')}' not found, skipped from playlist.")
+                    self.current_index = -1
 
-            self._items = loaded_items
-            if self._items:
-                self.current_index = 0  # Select first item by default
-            else:
-                self.current_index = -1
-
-            self.current_playlist_path = file_path
-            self.playlist_changed.emit()
+                self.current_playlist_path = file_path
+                self._emit_playlist_changed()
             if self.get_current_item():  # Emit if an item is now current
                 self.current_item_changed.emit(self.get_current_item(), self.current_index)
 
         except (IOError, json.JSONDecodeError) as e:
             print(f"Error loading playlist from {file_path}: {e}")
             raise
+
+
+if __name__ == '__main__':
+    # Quick check that each change emits playlist_changed exactly once, batched or not
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        paths = []
+        for name in ("a.mp4", "b.jpg", "c.mp3"):
+            paths.append(os.path.join(tmp_dir, name))
+            open(paths[-1], "wb").close()
+
+        pm = PlaylistManager()
+        emits = []
+        pm.playlist_changed.connect(lambda: emits.append(1))
+
+        pm.add_item(paths[0])
+        assert len(emits) == 1, emits
+        pm.add_items(paths[1:])
+        assert len(emits) == 2, emits
+        pm.remove_rows([0, 2])
+        assert len(emits) == 3, emits
+
+        with pm.batch_changes():
+            pm.add_items(paths)
+            pm.move_item(0, 1)
+            pm.remove_item(0)
+            assert len(emits) == 3, emits  # Nothing emitted until the batch ends
+        assert len(emits) == 4, emits
+        print(f"playlist_changed checks passed ({len(pm.get_items())} items)")
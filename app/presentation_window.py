@@ -1,10 +1,45 @@
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QApplication
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QPalette, QColor, QScreen
+from PyQt6.QtCore import Qt, QSize, QEvent, pyqtSignal
+from PyQt6.QtGui import QPalette, QColor, QScreen, QPainter
+
+_BLACK = QColor(0, 0, 0)
+
+
+@lru_cache(maxsize=1)
+def _build_black_palette():
+    """Palette with a black window background, built once and shared by all windows."""
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, _BLACK)
+    return palette
+
+
+class _VideoFrame(QWidget):
+    """Native child window that VLC renders into. Qt only ever paints it black."""
+    win_id_changed = pyqtSignal()  # Qt created a new native window for the frame
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # A native, opaque surface: Qt never erases it, so there's no flicker under the video
+        self.setAttribute(Qt.WidgetAttribute.WA_NativeWindow, True)
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+
+    def event(self, event):
+        if event.type() == QEvent.Type.WinIdChange:
+            self.win_id_changed.emit()
+        return super().event(event)
+
+    def paintEvent(self, event):
+        # Black until VLC draws its first frame (and behind letterboxing)
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), _BLACK)
+        painter.end()
 
 
 class PresentationWindow(QWidget):
     """Window for displaying media on the secondary screen."""
+    video_handle_changed = pyqtSignal(int)  # New native handle for VLC (see winId)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -12,9 +47,7 @@ class PresentationWindow(QWidget):
         self.setMinimumSize(QSize(640, 480))  # Minimum size
 
         # Set background to black
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Window, QColor("black"))
-        self.setPalette(palette)
+        self.setPalette(_build_black_palette())
         self.setAutoFillBackground(True)
 
         # Layout to hold the video frame or image
@@ -24,54 +57,56 @@ class PresentationWindow(QWidget):
         # This QWidget will be used by VLC to draw video.
         # For images, you might use a QLabel, or also use VLC.
         # Using a generic QWidget for VLC is common.
-        self.video_frame = QWidget(self)
-        # Ensure video_frame also has a black background if it's not filled by video
-        frame_palette = self.video_frame.palette()
-        frame_palette.setColor(QPalette.ColorRole.Window, QColor("black"))
-        self.video_frame.setPalette(frame_palette)
-        self.video_frame.setAutoFillBackground(True)
+        self.video_frame = _VideoFrame(self)
 
         layout.addWidget(self.video_frame)
         self.setLayout(layout)
 
         self.target_screen_index = -1  # -1 means auto or primary if only one
+        self._resolved_screen = None  # QScreen picked for target_screen_index, cached
+
+        # The cached screen is only valid while the screens (and which one is primary) stay the same
+        app = QApplication.instance()
+        if app:
+            app.screenAdded.connect(self._invalidate_resolved_screen)
+            app.screenRemoved.connect(self._invalidate_resolved_screen)
+            app.primaryScreenChanged.connect(self._invalidate_resolved_screen)
+
+        # Create the native window now so the handle given to VLC is stable, and keep it
+        self._cached_win_id = 0
+        self.video_frame.win_id_changed.connect(self._on_video_win_id_changed)
+        self._cached_win_id = int(self.video_frame.winId())
 
     def set_target_screen_index(self, index):
         """Set the preferred screen index for this window."""
         screens = QApplication.screens()
         if 0 <= index < len(screens):
             self.target_screen_index = index
-        elif len(screens) > 1:  # Auto-select non-primary if index is invalid
-            primary_screen = QApplication.primaryScreen()
-            for i, screen in enumerate(screens):
-                if screen != primary_screen:
-                    self.target_screen_index = i
-                    break
-            if self.target_screen_index == -1:  # Fallback if only primary or error
-                self.target_screen_index = 0 if len(screens) > 0 else -1
-        elif len(screens) == 1:
-            self.target_screen_index = 0  # Only one screen
-        else:
-            self.target_screen_index = -1  # No screens? Should not happen with GUI
-
-    def show_on_target_screen(self):
-        """Moves and shows the window on the target screen, fullscreen."""
+            self._resolved_screen = screens[index]
+        else:  # Auto-select: first non-primary screen, or the only one
+            self.target_screen_index = -1
+            screen = self._resolve_target_screen()
+            self.target_screen_index = screens.index(screen) if screen else -1  # -1: no screens?
+
+    def _resolve_target_screen(self):
+        """Picks the QScreen for target_screen_index (or a default) and caches it."""
         screens = QApplication.screens()
-        target_screen = None
-
+        screen = None
         if 0 <= self.target_screen_index < len(screens):
-            target_screen = screens[self.target_screen_index]
-        elif len(screens) > 1:  # Default to first non-primary if not set or invalid
+            screen = screens[self.target_screen_index]
+        elif screens:  # Default to first non-primary if not set or invalid
             primary = QApplication.primaryScreen()
-            for screen in screens:
-                if screen != primary:
-                    target_screen = screen
-                    break
-            if not target_screen:  # If all are primary (e.g. cloned) or only one screen
-                target_screen = QApplication.primaryScreen() if QApplication.primaryScreen() else screens[
-                    0] if screens else None
-        elif screens:  # Only one screen
-            target_screen = screens[0]
+            # If all are primary (e.g. cloned) or only one screen, use the primary one
+            screen = next((s for s in screens if s != primary), primary or screens[0])
+        self._resolved_screen = screen
+        return screen
+
+    def _invalidate_resolved_screen(self, *_):
+        self._resolved_screen = None
+
+    def show_on_target_screen(self):
+        """Moves and shows the window on the target screen, fullscreen."""
+        target_screen = self._resolved_screen or self._resolve_target_screen()
 
         if target_screen:
             self.setGeometry(target_screen.geometry())
@@ -83,9 +118,15 @@ class PresentationWindow(QWidget):
 
     def winId(self):
         """Returns the window ID of the video_frame for VLC."""
-        # Ensure the video_frame is created and has a valid window ID
-        # This might require the widget to be shown or at least created.
-        return self.video_frame.winId()
+        # Realized in __init__ (WA_NativeWindow) and kept current by _on_video_win_id_changed
+        return self._cached_win_id
+
+    def _on_video_win_id_changed(self):
+        # Qt recreated the frame's native window (e.g. re-parenting); VLC must be pointed at the new one
+        win_id = int(self.video_frame.winId())
+        if win_id and win_id != self._cached_win_id:
+            self._cached_win_id = win_id
+            self.video_handle_changed.emit(win_id)
 
     def display_image(self, qimage_or_path):
         """
@@ -41,7 +41,7 @@ class BackgroundAudioControls(QWidget):
         self.volume_slider.setRange(0, 100)
         self.volume_slider.setValue(50) # Default
         self.volume_slider.valueChanged.connect(self.volume_changed)
-        volume_layout.addLayout(volume_layout)
+        volume_layout.addWidget(self.volume_slider)
         layout.addLayout(volume_layout)
 
     def set_playing_state(self, is_playing):
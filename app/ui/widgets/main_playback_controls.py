@@ -1,6 +1,8 @@
 # app/ui/widgets/main_playback_controls.py
+from functools import lru_cache
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 
 class MainPlaybackControls(QWidget):
     """Widget for main media playback controls."""
@@ -15,6 +17,18 @@ class MainPlaybackControls(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Last values pushed to the widgets; update_time_display skips unchanged ones
+        self._last_cur_s = -1
+        self._last_tot_s = -1
+        self._last_slider = -1
+        self._slider_configured = False
+        self._slider_enabled = None
+        # Slider drags produce a move per pixel; only forward the latest position every 30 ms
+        self._pending_seek = -1
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(30)
+        self._seek_timer.timeout.connect(self._emit_pending_seek)
         self._init_ui()
 
     def _init_ui(self):
@@ -40,8 +54,9 @@ class MainPlaybackControls(QWidget):
         seek_layout = QHBoxLayout()
         self.current_time_label = QLabel("00:00")
         self.seek_slider = QSlider(Qt.Orientation.Horizontal)
-        self.seek_slider.sliderMoved.connect(self.seek_requested)
+        self.seek_slider.sliderMoved.connect(self._on_slider_moved)
         self.seek_slider.sliderPressed.connect(self.slider_pressed)
+        self.seek_slider.sliderReleased.connect(self._on_slider_released)
         self.seek_slider.sliderReleased.connect(self.slider_released)
         self.total_time_label = QLabel("00:00")
         seek_layout.addWidget(self.current_time_label)
@@ -62,39 +77,74 @@ class MainPlaybackControls(QWidget):
         self.play_pause_button.setText("Pause" if is_playing else "Play")
 
     def update_time_display(self, current_ms, total_ms):
-        self.current_time_label.setText(self._format_time(current_ms))
-        if total_ms >= 0 : # total_ms can be 0 if duration is unknown initially
-            self.total_time_label.setText(self._format_time(total_ms))
-            self.seek_slider.setEnabled(total_ms > 0)
-            if total_ms > 0:
-                self.seek_slider.setMaximum(1000) # Standard range for position 0.0-1.0
-                # Update slider position only if user is not dragging it
-                if not self.seek_slider.isSliderDown():
-                    position_ratio = current_ms / total_ms if total_ms > 0 else 0
-                    self.seek_slider.setValue(int(position_ratio * 1000))
-            else: # Unknown duration
-                self.seek_slider.setValue(0)
-        else: # Explicitly handle negative total_ms as unknown
+        if total_ms < 0:  # Explicitly handle negative total_ms as unknown
             self.total_time_label.setText("--:--")
             self.current_time_label.setText("--:--")
-            self.seek_slider.setEnabled(False)
+            self._set_slider_enabled(False)
+            self.seek_slider.setValue(0)
+            self._last_cur_s = self._last_tot_s = self._last_slider = -1
+            return
+
+        # Only touch widgets whose displayed value actually changes; this runs on every tick
+        cur_s = max(current_ms, 0) // 1000
+        if cur_s != self._last_cur_s:
+            self.current_time_label.setText(self._fmt_seconds(cur_s))
+            self._last_cur_s = cur_s
+        tot_s = total_ms // 1000  # total_ms can be 0 if duration is unknown initially
+        if tot_s != self._last_tot_s:
+            self.total_time_label.setText(self._fmt_seconds(tot_s))
+            self._last_tot_s = tot_s
+
+        self._set_slider_enabled(total_ms > 0)
+        if total_ms > 0:
+            if not self._slider_configured:
+                self.seek_slider.setMaximum(1000)  # Standard range for position 0.0-1.0
+                self._slider_configured = True
+            # Update slider position only if user is not dragging it
+            new_value = int(max(current_ms, 0) * 1000 / total_ms)
+            if new_value != self._last_slider and not self.seek_slider.isSliderDown():
+                self.seek_slider.setValue(new_value)
+                self._last_slider = new_value
+        elif self._last_slider != 0:  # Unknown duration
             self.seek_slider.setValue(0)
+            self._last_slider = 0
+
+    def _set_slider_enabled(self, enabled):
+        if enabled != self._slider_enabled:
+            self.seek_slider.setEnabled(enabled)
+            self._slider_enabled = enabled
+
+    def _on_slider_moved(self, value):
+        self._pending_seek = value
+        if not self._seek_timer.isActive():
+            self._seek_timer.start()
+
+    def _emit_pending_seek(self):
+        self._seek_timer.stop()
+        self.seek_requested.emit(self._pending_seek)
 
+    def _on_slider_released(self):
+        if self._seek_timer.isActive():  # Deliver the final position right away
+            self._emit_pending_seek()
+        self._last_slider = -1  # The user moved the handle; resync on the next update
 
     def reset_time_display(self):
         self.current_time_label.setText("00:00")
         self.total_time_label.setText("00:00")
         self.seek_slider.setValue(0)
-        self.seek_slider.setEnabled(False) # Usually disabled until media with duration loads
+        self._set_slider_enabled(False)  # Usually disabled until media with duration loads
+        self._last_cur_s = self._last_tot_s = 0
+        self._last_slider = 0
 
     def set_volume(self, volume):
         self.volume_slider.setValue(volume)
 
-    def _format_time(self, milliseconds):
-        if milliseconds < 0: milliseconds = 0
-        seconds = (milliseconds // 1000) % 60
-        minutes = (milliseconds // (1000 * 60)) % 60
-        return f"{minutes:02d}:{seconds:02d}"
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _fmt_seconds(total_seconds):
+        """Formats whole seconds as MM:SS. Cached, as the same values repeat every tick."""
+        minutes, seconds = divmod(total_seconds, 60)
+        return f"{minutes % 60:02d}:{seconds:02d}"
 
     def get_seek_slider_value(self):
         return self.seek_slider.value()
@@ -1,13 +1,149 @@
 # app/ui/widgets/playlist_panel.py
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLabel, QListWidget, QListWidgetItem)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListView,
+                             QApplication, QStyle, QStyledItemDelegate)
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QSize
+from PyQt6.QtGui import QPalette
+
+# Standard style icon shown next to each media type
+_TYPE_ICONS = {
+    'image': QStyle.StandardPixmap.SP_FileIcon,
+    'video': QStyle.StandardPixmap.SP_MediaPlay,
+    'audio': QStyle.StandardPixmap.SP_MediaVolume,
+}
+
+
+class PlaylistModel(QAbstractListModel):
+    """List model exposing MediaItems to a QListView without per-row item objects."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._items = []
+        self._icons = {}  # media_type -> QIcon, created on first use
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        media_item = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Built on demand, so only rows the view actually shows pay for it
+            return f"{index.row() + 1}. {media_item.display_name} ({media_item.media_type})"
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon_for(media_item.media_type)
+        if role == Qt.ItemDataRole.UserRole:
+            return media_item
+        return None
+
+    def _icon_for(self, media_type):
+        if media_type not in self._icons:
+            pixmap = _TYPE_ICONS.get(media_type)
+            self._icons[media_type] = QApplication.style().standardIcon(pixmap) if pixmap else None
+        return self._icons[media_type]
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled  # Allow dropping between rows
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable |
+                Qt.ItemFlag.ItemIsDragEnabled)
+
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        """Moves rows in place; QListView calls this for internal drag-and-drop."""
+        if source_parent.isValid() or destination_parent.isValid() or count <= 0:
+            return False
+        if source_row < 0 or source_row + count > len(self._items):
+            return False
+        if not 0 <= destination_child <= len(self._items):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False  # Dropped onto itself
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  destination_parent, destination_child):
+            return False
+        moved = self._items[source_row:source_row + count]
+        del self._items[source_row:source_row + count]
+        insert_at = destination_child - count if destination_child > source_row else destination_child
+        self._items[insert_at:insert_at] = moved
+        self.endMoveRows()
+        # Row numbers are part of the label, so every row in between needs repainting
+        first = min(source_row, insert_at)
+        last = max(source_row, insert_at) + count - 1
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.ItemDataRole.DisplayRole])
+        return True
+
+    def reset_items(self, media_items):
+        """Replaces the items, notifying the view only about the rows that actually changed."""
+        old, new = self._items, list(media_items)
+        # Skip the unchanged head and tail (compared by identity)
+        common = min(len(old), len(new))
+        head = 0
+        while head < common and old[head] is new[head]:
+            head += 1
+        tail = 0
+        while tail < common - head and old[-1 - tail] is new[-1 - tail]:
+            tail += 1
+        old_end, new_end = len(old) - tail, len(new) - tail  # Changed span is [head, *_end)
+
+        if new_end < old_end:
+            self.beginRemoveRows(QModelIndex(), new_end, old_end - 1)
+            self._items = old[:new_end] + old[old_end:]
+            self.endRemoveRows()
+        elif new_end > old_end:
+            self.beginInsertRows(QModelIndex(), old_end, new_end - 1)
+            self._items = old[:old_end] + new[old_end:new_end] + old[old_end:]
+            self.endInsertRows()
+        self._items = new
+
+        # Replaced rows need repainting; so does everything after an insert/remove (renumbered)
+        last = len(new) - 1 if new_end != old_end else min(old_end, new_end) - 1
+        if head <= last:
+            self.dataChanged.emit(self.index(head), self.index(last),
+                                  [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.DecorationRole])
+
+    def item_at(self, row):
+        return self._items[row] if 0 <= row < len(self._items) else None
+
+
+class MediaItemDelegate(QStyledItemDelegate):
+    """Paints a playlist row (icon + label) directly, with a fixed row height."""
+    ROW_HEIGHT = 24
+    _PADDING = 4
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        # Row background and selection highlight
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+
+        rect = option.rect.adjusted(self._PADDING, 0, -self._PADDING, 0)
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if icon is not None:
+            icon_size = rect.height() - 2 * self._PADDING
+            painter.drawPixmap(rect.left(), rect.top() + self._PADDING, icon.pixmap(icon_size, icon_size))
+            rect.setLeft(rect.left() + icon_size + self._PADDING)
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_role = QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        text = option.fontMetrics.elidedText(index.data(Qt.ItemDataRole.DisplayRole) or "",
+                                             Qt.TextElideMode.ElideRight, rect.width())
+        painter.save()
+        painter.setPen(option.palette.color(text_role))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
 
 class PlaylistPanel(QWidget):
     """Widget for displaying and managing the playlist."""
     add_media_requested = pyqtSignal()
-    remove_media_requested = pyqtSignal(list) # list of selected QListWidgetItems
-    item_double_clicked = pyqtSignal(QListWidgetItem)
+    remove_media_requested = pyqtSignal(list) # list of selected QModelIndexes
+    item_double_clicked = pyqtSignal(int) # row of the double-clicked item
     items_reordered = pyqtSignal() # Emitted after drag-drop
 
     def __init__(self, parent=None):
@@ -18,19 +154,20 @@ class PlaylistPanel(QWidget):
         layout = QVBoxLayout(self)
 
         layout.addWidget(QLabel("Playlist:"))
-        self.playlist_widget = QListWidget()
-        self.playlist_widget.setDragDropMode(QListWidget.DragDropMode.InternalMove)
-        self.playlist_widget.itemDoubleClicked.connect(self.item_double_clicked)
-        # For drag and drop reordering, QListWidget handles it internally.
-        # If you need to sync with PlaylistManager after a drop,
-        # you might need to connect to model().rowsMoved or similar,
-        # or handle it by rebuilding the playlist from the widget order.
-        # For simplicity, we can emit a generic items_reordered signal.
-        # A more robust way is to subclass QListWidget and override dropEvent.
-        # self.playlist_widget.model().rowsMoved.connect(lambda: self.items_reordered.emit())
-
-
-        layout.addWidget(self.playlist_widget)
+        self.playlist_model = PlaylistModel(self)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setItemDelegate(MediaItemDelegate(self.playlist_view))
+        # All rows are the same height and are laid out in batches, so only visible rows cost anything
+        self.playlist_view.setUniformItemSizes(True)
+        self.playlist_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.playlist_view.setDragDropMode(QListView.DragDropMode.InternalMove)
+        self.playlist_view.doubleClicked.connect(lambda index: self.item_double_clicked.emit(index.row()))
+        # Drag and drop reordering is done by PlaylistModel.moveRows.
+        # If you need to sync with PlaylistManager after a drop, connect items_reordered.
+        self.playlist_model.rowsMoved.connect(lambda *_: self.items_reordered.emit())
+
+        layout.addWidget(self.playlist_view)
 
         buttons_layout = QHBoxLayout()
         add_media_button = QPushButton("Add Files")
@@ -43,38 +180,29 @@ class PlaylistPanel(QWidget):
         layout.addLayout(buttons_layout)
 
     def _on_remove_media_clicked(self):
-        selected_items = self.playlist_widget.selectedItems()
-        if selected_items:
-            self.remove_media_requested.emit(selected_items)
+        selected_indexes = self.playlist_view.selectionModel().selectedRows()
+        if selected_indexes:
+            self.remove_media_requested.emit(selected_indexes)
 
     def update_view(self, media_items):
-        """Updates the QListWidget with items."""
-        current_selection = self.playlist_widget.currentRow() # Preserve selection if possible
-        self.playlist_widget.clear()
-        for i, media_item in enumerate(media_items):
-            # Assuming media_item has display_name and media_type attributes
-            item_widget = QListWidgetItem(f"{i+1}. {media_item.display_name} ({media_item.media_type})")
-            item_widget.setData(Qt.ItemDataRole.UserRole, media_item) # Store MediaItem object
-            self.playlist_widget.addItem(item_widget)
-        if 0 <= current_selection < self.playlist_widget.count():
-            self.playlist_widget.setCurrentRow(current_selection)
-
+        """Updates the view with items. Unchanged rows keep their state, including selection."""
+        self.playlist_model.reset_items(media_items)
 
     def get_all_list_widget_items(self):
-        """Returns all QListWidgetItems in their current order."""
-        return [self.playlist_widget.item(i) for i in range(self.playlist_widget.count())]
+        """Returns the model indexes of all rows in their current order."""
+        return [self.playlist_model.index(i) for i in range(self.playlist_model.rowCount())]
 
     def set_current_row(self, index):
-        if 0 <= index < self.playlist_widget.count():
-            self.playlist_widget.setCurrentRow(index)
+        if 0 <= index < self.playlist_model.rowCount():
+            self.playlist_view.setCurrentIndex(self.playlist_model.index(index))
 
     def get_selected_items_data(self):
-        """Returns the MediaItem data from selected QListWidgetItems."""
-        return [item.data(Qt.ItemDataRole.UserRole) for item in self.playlist_widget.selectedItems()]
+        """Returns the MediaItems of the selected rows."""
+        return [self.playlist_model.item_at(index.row())
+                for index in self.playlist_view.selectionModel().selectedRows()]
 
     def get_item_data_at_row(self, row):
-        item = self.playlist_widget.item(row)
-        return item.data(Qt.ItemDataRole.UserRole) if item else None
+        return self.playlist_model.item_at(row)
 
-    def get_row(self, item_widget):
-        return self.playlist_widget.row(item_widget)
+    def get_row(self, index):
+        return index.row() if index.isValid() else -1
@@ -1,51 +1,69 @@
+import functools
+import os
 import sys
-from PyQt6.QtWidgets import (QMainWindow, QApplication, QWidget, QVBoxLayout, QHBoxLayout,
-                             QPushButton, QLabel, QListWidget, QListWidgetItem, QFileDialog,
-                             QSlider, QSplitter, QMenuBar, QMessageBox, QDockWidget)
-from PyQt6.QtGui import QAction, QScreen
-from PyQt6.QtCore import Qt, QSize, QTimer, QFileInfo
-
-from .presentation_window import PresentationWindow
-from .playlist_module import PlaylistManager, MediaItem
-from .playback_module import PlaybackController, BackgroundAudioManager
+import time
+from PyQt6.QtWidgets import (QMainWindow, QApplication, QWidget, QVBoxLayout, QLabel, QFileDialog,
+                             QSplitter, QMessageBox, QAbstractSlider, QAbstractSpinBox, QLineEdit,
+                             QTextEdit, QPlainTextEdit)
+from PyQt6.QtGui import QAction, QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QEvent, QTimer, QSignalBlocker, QThreadPool
+
+from .playlist_module import PlaylistManager
+from .playback_module import PlaybackController, BackgroundAudioManager, shutdown_vlc
+from . import _lazy_vlc as vlc  # python-vlc is imported on first use
 from .config_module import SettingsManager
+from .utils import MEDIA_FILTER, AUDIO_FILTER, PLAYLIST_FILTER
 
-# Import the new widget panels
-try:
-    from .ui.widgets.playlist_panel import PlaylistPanel
-    from .ui.widgets.main_playback_controls import MainPlaybackControls
-    from .ui.widgets.background_audio_controls import BackgroundAudioControls
-except ImportError as e:
-    # Fallback for direct execution or if 'ui.widgets' is not found initially
-    # This might happen if you run ui_module.py directly without the project structure fully recognized
-    # Or if __init__.py is missing in app/ui/
-    print(f"ImportError for widgets: {e}. Attempting relative import for development.")
+# Focused widgets that need the transport keys themselves (arrows, Space, Escape)
+_KEY_CONSUMING_WIDGETS = (QAbstractSlider, QAbstractSpinBox, QLineEdit, QTextEdit, QPlainTextEdit)
+
+
+def _load_panel_classes():
+    """Imports the widget panel classes when the UI is built, not when this module is imported.
+
+    Returns (PlaylistPanel, MainPlaybackControls, BackgroundAudioControls); all None if the import fails.
+    """
     try:
-        # Assuming ui_module.py is in app/ and widgets are in app/ui/widgets/
-        # This relative path might be tricky depending on how the script is run.
-        # For a proper package structure, the first try block should work.
-        from ui.widgets.playlist_panel import PlaylistPanel
-        from ui.widgets.main_playback_controls import MainPlaybackControls
-        from ui.widgets.background_audio_controls import BackgroundAudioControls
-    except ImportError:
-        # Final fallback for the case where ui_module.py is run from within app/
-        # and ui/widgets is a sibling directory to ui_module.py's location.
-        # This is less standard for package structures.
-        # from ..ui.widgets.playlist_panel import PlaylistPanel
-        # from ..ui.widgets.main_playback_controls import MainPlaybackControls
-        # from ..ui.widgets.background_audio_controls import BackgroundAudioControls
-        # For now, let's assume the first try works with a proper project setup.
-        # If errors persist, ensure app/ui/__init__.py and app/ui/widgets/__init__.py exist
-        # and that PyCharm recognizes app as a sources root.
-        print("Could not import widget panels. Ensure app/ui/widgets path is correct and __init__.py files exist.")
-        # As a last resort for the code to run without widgets if imports fail:
-        PlaylistPanel = MainPlaybackControls = BackgroundAudioControls = None
-
-# Placeholder for vlc
-try:
-    import vlc
-except ImportError:
-    vlc = None
+        from .ui.widgets.playlist_panel import PlaylistPanel
+        from .ui.widgets.main_playback_controls import MainPlaybackControls
+        from .ui.widgets.background_audio_controls import BackgroundAudioControls
+    except ImportError as e:
+        # Fallback for direct execution or if 'ui.widgets' is not found initially
+        # This might happen if you run ui_module.py directly without the project structure fully recognized
+        # Or if __init__.py is missing in app/ui/
+        print(f"ImportError for widgets: {e}. Attempting relative import for development.")
+        try:
+            # Assuming ui_module.py is in app/ and widgets are in app/ui/widgets/
+            # This relative path might be tricky depending on how the script is run.
+            # For a proper package structure, the first try block should work.
+            from ui.widgets.playlist_panel import PlaylistPanel
+            from ui.widgets.main_playback_controls import MainPlaybackControls
+            from ui.widgets.background_audio_controls import BackgroundAudioControls
+        except ImportError:
+            # If errors persist, ensure app/ui/__init__.py and app/ui/widgets/__init__.py exist
+            # and that PyCharm recognizes app as a sources root.
+            print("Could not import widget panels. Ensure app/ui/widgets path is correct and __init__.py files exist.")
+            # As a last resort for the code to run without widgets if imports fail:
+            return None, None, None
+    return PlaylistPanel, MainPlaybackControls, BackgroundAudioControls
+
+
+def requires_player(fn):
+    """Slot decorator: does nothing unless the main playback controller has a player."""
+    @functools.wraps(fn)
+    def wrap(self, *args, **kwargs):
+        pc = self.playback_controller
+        return fn(self, *args, **kwargs) if pc and pc.player else None
+    return wrap
+
+
+def requires_bg_player(fn):
+    """Slot decorator: does nothing unless the background audio manager has a player."""
+    @functools.wraps(fn)
+    def wrap(self, *args, **kwargs):
+        bg = self.background_audio_manager
+        return fn(self, *args, **kwargs) if bg and bg.player else None
+    return wrap
 
 
 class MainWindow(QMainWindow):
@@ -58,6 +76,23 @@ class MainWindow(QMainWindow):
         self.presentation_window = None
         self.playback_controller = None
         self.background_audio_manager = None
+        # Player states in which play/pause starts the current item over, set in _init_vlc_components
+        self._restart_states = frozenset({None})
+        self._seeking = False  # User is dragging the seek slider; ignore position events
+        self._current_duration_ms = -1  # Length of the current main media, from media_duration_changed
+        self._progress_fallback_timer = None  # Created in _init_vlc_components
+        # Bound methods used by the progress display, set in _init_vlc_components
+        self._get_time = None
+        self._update_time_display = None
+        self._last_status = ("", 0.0)  # (message, time.monotonic()) of the last status bar update
+        self._file_dialogs = {}  # role -> QFileDialog, created on first use and reused
+        self._playlist_dirty = False  # A playlist view refresh is queued for the next event loop pass
+        # Screen list, refreshed only when screens are added, removed or the primary changes
+        self._screens = QApplication.screens()
+        app = QApplication.instance()
+        app.screenAdded.connect(self._refresh_screens)
+        app.screenRemoved.connect(self._refresh_screens)
+        app.primaryScreenChanged.connect(self._refresh_screens)
 
         self.setWindowTitle("Media Presenter Control")
         self.setGeometry(100, 100, 1200, 700)
@@ -68,10 +103,6 @@ class MainWindow(QMainWindow):
         self._load_settings()
         self._connect_manager_signals()  # Connect signals from backend managers
 
-        self.playback_update_timer = QTimer(self)
-        self.playback_update_timer.setInterval(500)
-        self.playback_update_timer.timeout.connect(self._update_main_playback_progress)
-
     def _init_ui_structure(self):
         """Initialize the main UI structure and instantiate custom widgets."""
         # --- Menu Bar ---
@@ -98,11 +129,25 @@ class MainWindow(QMainWindow):
         self.toggle_presentation_action.triggered.connect(self._toggle_presentation_window_visibility)
         view_menu.addAction(self.toggle_presentation_action)
 
+        # --- Transport Shortcuts ---
+        # Go straight to the playback slots; sliders and text fields keep these keys while focused (eventFilter)
+        bindings = self.settings_manager.get_keyboard_bindings()
+        self._transport_keys = set()  # QKeyCombination.toCombined() of each transport shortcut
+        for action_name, default_key, slot in (("playPause", "Space", self._toggle_main_play_pause),
+                                               ("nextItem", "Right", self._play_next_item),
+                                               ("previousItem", "Left", self._play_previous_item),
+                                               ("stop", "Escape", self._stop_main_playback)):
+            sequence = QKeySequence(bindings.get(action_name) or default_key)
+            QShortcut(sequence, self).activated.connect(slot)
+            if sequence.count():
+                self._transport_keys.add(sequence[0].toCombined())
+
         # --- Main Layout (Splitter) ---
         main_splitter = QSplitter(Qt.Orientation.Horizontal, self)
         self.setCentralWidget(main_splitter)
 
         # --- Instantiate Custom Widgets ---
+        PlaylistPanel, MainPlaybackControls, BackgroundAudioControls = _load_panel_classes()
         if PlaylistPanel:
             self.playlist_panel = PlaylistPanel()
             main_splitter.addWidget(self.playlist_panel)
@@ -135,21 +180,42 @@ class MainWindow(QMainWindow):
         main_splitter.addWidget(controls_container)
         main_splitter.setSizes([300, 700])
 
-        self.statusBar().showMessage("Ready")
+        # Let focused sliders and text fields keep the transport keys
+        for widget_type in _KEY_CONSUMING_WIDGETS:
+            for widget in self.findChildren(widget_type):
+                widget.installEventFilter(self)
+
+        self._status("Ready")
 
     def _init_vlc_components(self):
-        if not vlc:
+        try:
+            # First attribute access performs the deferred python-vlc import (and loads libvlc)
+            self._restart_states = frozenset({vlc.State.Ended, vlc.State.Stopped, vlc.State.Error,
+                                              None, vlc.State.NothingSpecial})
+        except ImportError:
             QMessageBox.critical(self, "VLC Error", "python-vlc or VLC library not found.")
             return
 
         self._setup_presentation_window()
 
         if self.presentation_window and self.presentation_window.video_frame:
-            self.playback_controller = PlaybackController(self.presentation_window.video_frame.winId())
+            self.playback_controller = PlaybackController(self.presentation_window.winId())
             self.playback_controller.media_ended.connect(self._handle_main_media_ended)
             self.playback_controller.media_duration_changed.connect(self._update_main_media_duration_display)
             self.playback_controller.error_occurred.connect(self._show_playback_error)
-            # Position changed is handled by timer for main playback
+            self.presentation_window.video_handle_changed.connect(self.playback_controller.set_video_output)
+            # Progress is pushed by VLC position events (queued onto the GUI thread), no polling
+            self.playback_controller.media_position_changed.connect(self._on_main_media_position_changed)
+            # Fallback for when VLC goes quiet (silent or stalled streams): restarted by every
+            # position event, so it only polls get_time() after a second without one
+            self._progress_fallback_timer = QTimer(self)
+            self._progress_fallback_timer.setInterval(1000)
+            self._progress_fallback_timer.timeout.connect(self._update_main_playback_progress)
+            self._progress_fallback_timer.start()
+            if self.main_playback_controls:
+                # Bound once rather than looked up on every progress update
+                self._get_time = self.playback_controller.get_time
+                self._update_time_display = self.main_playback_controls.update_time_display
         else:
             # Only show warning if presentation_window itself exists but its frame doesn't
             if self.presentation_window:
@@ -157,7 +223,7 @@ class MainWindow(QMainWindow):
             # If presentation_window is None, _setup_presentation_window likely failed silently or was skipped.
 
         self.background_audio_manager = BackgroundAudioManager()
-        if self.background_audio_manager.player is None and vlc:  # Check if VLC was available during BackgroundAudioManager init
+        if self.background_audio_manager.player is None:  # Check if VLC was available during BackgroundAudioManager init
             QMessageBox.warning(self, "VLC Error", "BG Audio Manager: VLC player init failed.")
         self.background_audio_manager.error_occurred.connect(self._show_playback_error)
 
@@ -176,8 +242,8 @@ class MainWindow(QMainWindow):
             self.main_playback_controls.previous_clicked.connect(self._play_previous_item)
             self.main_playback_controls.seek_requested.connect(self._seek_main_media)
             self.main_playback_controls.volume_changed.connect(self._set_main_playback_volume)
-            self.main_playback_controls.slider_pressed.connect(self._pause_timer_on_seek)
-            self.main_playback_controls.slider_released.connect(self._resume_timer_after_seek)
+            self.main_playback_controls.slider_pressed.connect(self._on_seek_slider_pressed)
+            self.main_playback_controls.slider_released.connect(self._on_seek_slider_released)
 
         if self.bg_audio_controls:  # Check if widget was successfully created
             self.bg_audio_controls.load_requested.connect(self._load_background_audio_dialog)
@@ -212,8 +278,7 @@ class MainWindow(QMainWindow):
         if self.presentation_window:  # Check if presentation_window exists
             self.presentation_window.set_target_screen_index(screen_index)
             self.presentation_window.show_on_target_screen()
-            if hasattr(self, 'toggle_presentation_action'):  # Ensure action exists
-                self.toggle_presentation_action.setChecked(self.presentation_window.isVisible())
+            self._sync_presentation_action()
 
     def _save_settings(self):
         self.settings_manager.set_setting("mainWindowGeometry", self.saveGeometry())
@@ -230,12 +295,12 @@ class MainWindow(QMainWindow):
 
     def _setup_presentation_window(self):
         if not self.presentation_window:
+            from .presentation_window import PresentationWindow  # Only needed once VLC is available
             self.presentation_window = PresentationWindow()
             screen_idx = self.settings_manager.get_setting("presentationScreenIndex", -1)
             self.presentation_window.set_target_screen_index(screen_idx)
             self.presentation_window.show_on_target_screen()
-            if hasattr(self, 'toggle_presentation_action'):  # Ensure action exists
-                self.toggle_presentation_action.setChecked(self.presentation_window.isVisible())
+            self._sync_presentation_action()
 
     def _toggle_presentation_window_visibility(self, checked):
         if not self.presentation_window:
@@ -245,12 +310,29 @@ class MainWindow(QMainWindow):
                 self.presentation_window.show_on_target_screen()
             else:
                 self.presentation_window.hide()
+        self._sync_presentation_action()
+
+    def _sync_presentation_action(self):
+        """Checks the View menu action to match the presentation window, without emitting its signals."""
         if hasattr(self, 'toggle_presentation_action'):  # Ensure action exists
-            self.toggle_presentation_action.setChecked(
-                self.presentation_window.isVisible() if self.presentation_window else False)
+            with QSignalBlocker(self.toggle_presentation_action):
+                self.toggle_presentation_action.setChecked(
+                    self.presentation_window.isVisible() if self.presentation_window else False)
+
+    def eventFilter(self, obj, event):
+        # Installed on sliders and text fields: claiming ShortcutOverride makes Qt deliver the
+        # key to the widget instead of firing the window-wide transport shortcut
+        if event.type() == QEvent.Type.ShortcutOverride and \
+                event.keyCombination().toCombined() in self._transport_keys:
+            event.accept()
+            return True
+        return super().eventFilter(obj, event)
+
+    def _refresh_screens(self, *_):
+        self._screens = QApplication.screens()
 
     def _open_settings_dialog(self):
-        screens = QApplication.screens()
+        screens = self._screens
         if len(screens) > 1 and self.presentation_window:
             screen_names = [f"Screen {i + 1}: {s.name()} ({s.geometry().width()}x{s.geometry().height()})" for i, s in
                             enumerate(screens)]
@@ -269,66 +351,86 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.information(self, "Screen Settings",
                                     "Multiple screens not detected or presentation window unavailable.")
-        self.statusBar().showMessage("Settings dialog accessed.")
+        self._status("Settings dialog accessed.")
+
+    def _file_dialog(self, role, caption, name_filter, file_mode=QFileDialog.FileMode.ExistingFile,
+                     accept_mode=QFileDialog.AcceptMode.AcceptOpen):
+        """Returns the file dialog for role, building it the first time it's needed."""
+        dialog = self._file_dialogs.get(role)
+        if dialog is None:
+            dialog = QFileDialog(self, caption)
+            # Qt's own dialog can be kept around and reopened; native ones are rebuilt on every exec()
+            dialog.setOption(QFileDialog.Option.DontUseNativeDialog)
+            dialog.setNameFilter(name_filter)
+            dialog.setFileMode(file_mode)
+            dialog.setAcceptMode(accept_mode)
+            self._file_dialogs[role] = dialog
+        return dialog
 
     # --- Playlist Management Methods ---
     def add_media_to_playlist_dialog(self):
-        file_paths, _ = QFileDialog.getOpenFileNames(self, "Add Media",
-                                                     self.settings_manager.get_setting("lastMediaBrowsePath", ""),
-                                                     "Media (*.mp4 *.avi *.mkv *.jpg *.jpeg *.png *.bmp *.gif *.mp3 *.wav *.aac *.ogg *.flac);;Video (*.mp4 *.avi *.mkv);;Images (*.jpg *.jpeg *.png *.bmp *.gif);;Audio (*.mp3 *.wav *.aac *.ogg *.flac);;All (*)")
+        dialog = self._file_dialog("media", "Add Media", MEDIA_FILTER, QFileDialog.FileMode.ExistingFiles)
+        dialog.setDirectory(self.settings_manager.get_setting("lastMediaBrowsePath", ""))
+        file_paths = dialog.selectedFiles() if dialog.exec() else []
         if file_paths:
-            self.settings_manager.set_setting("lastMediaBrowsePath", QFileInfo(file_paths[0]).absolutePath())
-            for path in file_paths:
-                self.playlist_manager.add_item(path)
+            self.settings_manager.set_setting("lastMediaBrowsePath", os.path.dirname(file_paths[0]))
+            self.playlist_manager.add_items(file_paths)
             # PlaylistManager's playlist_changed signal will call _update_playlist_panel_view
 
-    def remove_selected_media_from_playlist(self, selected_list_widget_items):
-        # The PlaylistPanel gives us QListWidgetItems. We need to find their rows to remove from PlaylistManager.
+    def remove_selected_media_from_playlist(self, selected_indexes):
+        # The PlaylistPanel gives us QModelIndexes. We need their rows to remove from PlaylistManager.
         if not self.playlist_panel: return
 
-        rows_to_remove = sorted([self.playlist_panel.get_row(item) for item in selected_list_widget_items],
-                                reverse=True)
-        for row in rows_to_remove:
-            if row >= 0:  # Ensure row index is valid
-                self.playlist_manager.remove_item(row)
+        self.playlist_manager.remove_rows([self.playlist_panel.get_row(index) for index in selected_indexes])
 
     def _update_playlist_panel_view(self):
+        # Coalesce bursts of playlist_changed into a single refresh
+        if self._playlist_dirty:
+            return
+        self._playlist_dirty = True
+        QTimer.singleShot(0, self._flush_playlist_view)
+
+    def _flush_playlist_view(self):
+        self._playlist_dirty = False
         if self.playlist_panel:
-            self.playlist_panel.update_view(self.playlist_manager.get_items())
-            current_pl_index = self.playlist_manager.current_index
-            if current_pl_index != -1:
-                self.playlist_panel.set_current_row(current_pl_index)
+            # Don't let the refresh re-enter selection slots
+            with QSignalBlocker(self.playlist_panel):
+                self.playlist_panel.update_view(self.playlist_manager.get_items())
+                current_pl_index = self.playlist_manager.current_index
+                if current_pl_index != -1:
+                    self.playlist_panel.set_current_row(current_pl_index)
 
     def load_playlist_dialog(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Open Playlist",
-                                              self.settings_manager.get_setting("lastPlaylistPath", ""),
-                                              "JSON Playlist (*.json);;All Files (*)")
+        dialog = self._file_dialog("playlist_open", "Open Playlist", PLAYLIST_FILTER)
+        dialog.selectFile(self.settings_manager.get_setting("lastPlaylistPath", ""))
+        path = dialog.selectedFiles()[0] if dialog.exec() else ""
         if path:
             try:
                 self.playlist_manager.load_playlist(path)
                 self.settings_manager.set_setting("lastPlaylistPath", path)
-                self.statusBar().showMessage(f"Playlist loaded: {path}")
+                self._status(f"Playlist loaded: {path}")
             except Exception as e:
                 QMessageBox.critical(self, "Load Error", f"Failed to load playlist: {e}")
 
     def save_playlist_dialog(self):
         default_path = self.playlist_manager.current_playlist_path or self.settings_manager.get_setting(
             "lastPlaylistPath", "")
-        path, _ = QFileDialog.getSaveFileName(self, "Save Playlist", default_path,
-                                              "JSON Playlist (*.json);;All Files (*)")
+        dialog = self._file_dialog("playlist_save", "Save Playlist", PLAYLIST_FILTER,
+                                   QFileDialog.FileMode.AnyFile, QFileDialog.AcceptMode.AcceptSave)
+        dialog.selectFile(default_path)
+        path = dialog.selectedFiles()[0] if dialog.exec() else ""
         if path:
             try:
                 self.playlist_manager.save_playlist(path)
                 self.settings_manager.set_setting("lastPlaylistPath", path)
-                self.statusBar().showMessage(f"Playlist saved: {path}")
+                self.settings_manager.flush_now()
+                self._status(f"Playlist saved: {path}")
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", f"Failed to save playlist: {e}")
 
-    def _on_playlist_listwidget_item_double_clicked(self, item_widget: QListWidgetItem):
-        if self.playlist_panel:
-            row = self.playlist_panel.get_row(item_widget)
-            if self.playlist_manager.set_current_index(row):
-                self._play_current_main_playlist_item()
+    def _on_playlist_listwidget_item_double_clicked(self, row: int):
+        if self.playlist_manager.set_current_index(row):
+            self._play_current_main_playlist_item()
 
     # --- Main Playback Control Methods ---
     def _play_current_main_playlist_item(self):
@@ -337,64 +439,58 @@ class MainWindow(QMainWindow):
             return
         current_item = self.playlist_manager.get_current_item()
         if current_item:
-            self.statusBar().showMessage(f"Playing: {current_item.display_name}")
+            self._status(f"Playing: {current_item.display_name}")
             if self.playback_controller.play_media(current_item.path, current_item.media_type):
                 if self.main_playback_controls:
                     self.main_playback_controls.set_playing_state(True)
-                self.playback_update_timer.start()
                 if self.playlist_panel:  # Update selection in panel
                     self.playlist_panel.set_current_row(self.playlist_manager.current_index)
             # else: error is handled by playback_controller's signal
         else:
-            self.statusBar().showMessage("No item to play.")
+            self._status("No item to play.")
             self.playback_controller.stop()  # Ensure player is stopped
             if self.main_playback_controls:
                 self.main_playback_controls.set_playing_state(False)
                 self.main_playback_controls.reset_time_display()
-            self.playback_update_timer.stop()
 
+    @requires_player
     def _toggle_main_play_pause(self):
-        if not self.playback_controller or not self.playback_controller.player: return
         if self.playback_controller.is_playing():
             self.playback_controller.pause()
             if self.main_playback_controls: self.main_playback_controls.set_playing_state(False)
-            self.playback_update_timer.stop()
-            self.statusBar().showMessage("Paused.")
+            self._status("Paused.")
         else:
             # Check if media is loaded or if player is in a state that requires starting from current/first item
             if not self.playback_controller.get_current_media_path() or \
-                    self.playback_controller.get_player_state() in [vlc.State.Ended, vlc.State.Stopped, vlc.State.Error,
-                                                                    None, vlc.State.NothingSpecial]:
+                    self.playback_controller.get_player_state() in self._restart_states:
                 self._play_current_main_playlist_item()
             else:  # Resume from paused state
                 self.playback_controller.resume()
                 if self.main_playback_controls: self.main_playback_controls.set_playing_state(True)
-                self.playback_update_timer.start()
-                self.statusBar().showMessage("Resumed.")
+                self._status("Resumed.")
 
+    @requires_player
     def _stop_main_playback(self):
-        if not self.playback_controller or not self.playback_controller.player: return
         self.playback_controller.stop()
         if self.main_playback_controls:
             self.main_playback_controls.set_playing_state(False)
             self.main_playback_controls.reset_time_display()
-        self.playback_update_timer.stop()
-        self.statusBar().showMessage("Stopped.")
+        self._status("Stopped.")
 
     def _play_next_item(self):
         if self.playlist_manager.select_next():
             self._play_current_main_playlist_item()
         else:
-            self.statusBar().showMessage("End of playlist.")
+            self._status("End of playlist.")
 
     def _play_previous_item(self):
         if self.playlist_manager.select_previous():
             self._play_current_main_playlist_item()
         else:
-            self.statusBar().showMessage("Start of playlist.")
+            self._status("Start of playlist.")
 
     def _handle_main_media_ended(self):
-        self.statusBar().showMessage("Media finished.")
+        self._status("Media finished.")
         if self.settings_manager.get_setting("autoPlayNext", True):
             self._play_next_item()
         else:
@@ -402,106 +498,126 @@ class MainWindow(QMainWindow):
                 self.main_playback_controls.set_playing_state(False)
                 # Current time should be at the end, total duration remains.
                 # self.main_playback_controls.update_time_display(self.playback_controller.get_duration(), self.playback_controller.get_duration())
-            self.playback_update_timer.stop()
 
+    @requires_player
     def _update_main_playback_progress(self):
-        if not self.playback_controller or not self.playback_controller.player or \
-                not self.playback_controller.is_playing() or not self.main_playback_controls:
+        update = self._update_time_display
+        if update is None or self._seeking or not self.playback_controller.is_playing():
             return
+        update(self._get_time(), self._current_duration_ms)
 
-        current_ms = int(self.playback_controller.get_position() * self.playback_controller.get_duration())
-        total_ms = self.playback_controller.get_duration()
-        self.main_playback_controls.update_time_display(current_ms, total_ms)
+    def _on_main_media_position_changed(self, position):
+        """Slot for PlaybackController.media_position_changed (position is a 0.0-1.0 ratio)."""
+        self._progress_fallback_timer.start()  # Events are flowing; push the fallback poll back
+        update = self._update_time_display
+        if self._seeking or update is None:
+            return
+        total_ms = self._current_duration_ms
+        update(int(position * total_ms), total_ms)
 
     def _update_main_media_duration_display(self, duration_ms):
+        self._current_duration_ms = duration_ms if duration_ms >= 0 else -1
         if self.main_playback_controls:
             # When duration changes (new media loaded), reset current time display part
             self.main_playback_controls.update_time_display(0, duration_ms if duration_ms >= 0 else -1)
 
+    @requires_player
     def _seek_main_media(self, slider_value):  # slider_value is 0-1000
-        if not self.playback_controller or not self.playback_controller.player or not self.playback_controller.can_seek():
+        if not self.playback_controller.can_seek():
             return
 
         slider_max = self.main_playback_controls.get_seek_slider_max() if self.main_playback_controls else 1000
         target_pos = float(slider_value) / slider_max if slider_max > 0 else 0.0  # Convert to 0.0-1.0
+        # MainPlaybackControls already limits seek_requested to one emit per 30 ms
         self.playback_controller.set_position(target_pos)
 
         # Update time label immediately
         if self.main_playback_controls:
-            duration_ms = self.playback_controller.get_duration()
+            duration_ms = self._current_duration_ms
             current_time_ms = int(target_pos * duration_ms)
             self.main_playback_controls.update_time_display(current_time_ms, duration_ms)
 
-    def _pause_timer_on_seek(self):
-        if self.playback_update_timer.isActive():
-            self.playback_update_timer.stop()
+    def _on_seek_slider_pressed(self):
+        self._seeking = True
 
-    def _resume_timer_after_seek(self):
-        if self.playback_controller and self.playback_controller.player and self.playback_controller.is_playing():
-            self.playback_update_timer.start()
-            # After user releases slider, ensure the display updates to actual player position
-            self._update_main_playback_progress()
+    def _on_seek_slider_released(self):
+        self._seeking = False
+        # After user releases slider, ensure the display updates to actual player position
+        self._update_main_playback_progress()
 
+    @requires_player
     def _set_main_playback_volume(self, volume):
-        if not self.playback_controller or not self.playback_controller.player: return
         self.playback_controller.set_volume(volume)
-        self.statusBar().showMessage(f"Main Volume: {volume}%")
+        self._status(f"Main Volume: {volume}%")
 
     # --- Background Audio Control Methods ---
     def _load_background_audio_dialog(self):
         if not self.background_audio_manager or not self.background_audio_manager.player:
             self._show_playback_error("Background audio player not ready.")
             return
-        path, _ = QFileDialog.getOpenFileName(self, "Load BG Audio",
-                                              self.settings_manager.get_setting("lastBgAudioPath", ""),
-                                              "Audio Files (*.mp3 *.wav *.aac *.ogg *.flac);;All Files (*)")
+        dialog = self._file_dialog("bg_audio", "Load BG Audio", AUDIO_FILTER)
+        dialog.setDirectory(self.settings_manager.get_setting("lastBgAudioPath", ""))
+        path = dialog.selectedFiles()[0] if dialog.exec() else ""
         if path:
-            self.settings_manager.set_setting("lastBgAudioPath", QFileInfo(path).absolutePath())
+            self.settings_manager.set_setting("lastBgAudioPath", os.path.dirname(path))
             if self.background_audio_manager.load_media(path):
                 if self.bg_audio_controls: self.bg_audio_controls.set_playing_state(False)
-                self.statusBar().showMessage(f"BG audio loaded: {QFileInfo(path).fileName()}")
+                self._status(f"BG audio loaded: {os.path.basename(path)}")
 
+    @requires_bg_player
     def _toggle_background_audio_play_pause(self):
-        if not self.background_audio_manager or not self.background_audio_manager.player: return
         if self.background_audio_manager.is_playing():
             self.background_audio_manager.pause()
             if self.bg_audio_controls: self.bg_audio_controls.set_playing_state(False)
-            self.statusBar().showMessage("BG audio paused.")
+            self._status("BG audio paused.")
         else:
             if self.background_audio_manager.get_current_media_path():
                 if self.background_audio_manager.play():
                     if self.bg_audio_controls: self.bg_audio_controls.set_playing_state(True)
-                    self.statusBar().showMessage("BG audio playing.")
+                    self._status("BG audio playing.")
             else:
-                self.statusBar().showMessage("No BG audio loaded.")
+                self._status("No BG audio loaded.")
 
+    @requires_bg_player
     def _stop_background_audio(self):
-        if not self.background_audio_manager or not self.background_audio_manager.player: return
         self.background_audio_manager.stop()
         if self.bg_audio_controls: self.bg_audio_controls.set_playing_state(False)
-        self.statusBar().showMessage("BG audio stopped.")
+        self._status("BG audio stopped.")
 
+    @requires_bg_player
     def _toggle_background_audio_loop(self, checked):
-        if not self.background_audio_manager or not self.background_audio_manager.player: return
         self.background_audio_manager.set_loop(checked)
         if self.bg_audio_controls: self.bg_audio_controls.set_loop_state(checked)
-        self.statusBar().showMessage(f"BG audio loop: {'ON' if checked else 'OFF'}")
+        self._status(f"BG audio loop: {'ON' if checked else 'OFF'}")
 
+    @requires_bg_player
     def _set_background_audio_volume(self, volume):
-        if not self.background_audio_manager or not self.background_audio_manager.player: return
         self.background_audio_manager.set_volume(volume)
-        self.statusBar().showMessage(f"BG Volume: {volume}%")
+        self._status(f"BG Volume: {volume}%")
 
     # --- General ---
+    def _status(self, message):
+        """Shows message in the status bar, skipping a repeat of the same message within 100 ms."""
+        now = time.monotonic()
+        last_message, last_time = self._last_status
+        if message == last_message and now - last_time < 0.1:
+            return
+        self._last_status = (message, now)
+        self.statusBar().showMessage(message)
+
     def _show_playback_error(self, error_message):
         QMessageBox.warning(self, "Playback Error", error_message)
-        self.statusBar().showMessage(f"Error: {error_message}")
+        self._status(f"Error: {error_message}")
 
     def closeEvent(self, event):
-        self._save_settings()
+        self._save_settings()  # Only buffers the values (geometry must be read while still shown)
+        self.hide()  # Disappear right away; the rest of the teardown happens behind the scenes
+        self.settings_manager.flush_in_background()  # Disk write overlaps with releasing VLC
         if self.playback_controller: self.playback_controller.release_player()
         if self.background_audio_manager: self.background_audio_manager.release_player()
+        shutdown_vlc()
         if self.presentation_window: self.presentation_window.close()
+        QThreadPool.globalInstance().waitForDone()  # Don't exit before the settings are on disk
         super().closeEvent(event)
 
 
@@ -515,6 +631,12 @@ if __name__ == '__main__':
 
         def set_setting(self, key, value): pass
 
+        def flush_now(self): pass
+
+        def flush_in_background(self): pass
+
+        def get_keyboard_bindings(self): return {}
+
 
     settings_mgr = DummySettingsManager()
     main_win = MainWindow(settings_mgr)
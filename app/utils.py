@@ -5,6 +5,24 @@
 # Example Constant:
 # DEFAULT_IMAGE_DURATION_MS = 5000
 
+# Supported media extensions; the playlist's type detection and the file dialog filters are built from these
+VIDEO_EXTENSIONS = ("mp4", "avi", "wmv", "mkv", "mov", "flv")
+IMAGE_EXTENSIONS = ("jpg", "jpeg", "png", "bmp", "gif")
+AUDIO_EXTENSIONS = ("mp3", "wav", "aac", "ogg", "flac", "m4a")
+
+
+def _patterns(extensions):
+    return " ".join(f"*.{ext}" for ext in extensions)
+
+
+MEDIA_FILTER = (f"Media ({_patterns(VIDEO_EXTENSIONS + IMAGE_EXTENSIONS + AUDIO_EXTENSIONS)});;"
+                f"Video ({_patterns(VIDEO_EXTENSIONS)});;"
+                f"Images ({_patterns(IMAGE_EXTENSIONS)});;"
+                f"Audio ({_patterns(AUDIO_EXTENSIONS)});;"
+                "All (*)")
+AUDIO_FILTER = f"Audio Files ({_patterns(AUDIO_EXTENSIONS)});;All Files (*)"
+PLAYLIST_FILTER = "JSON Playlist (*.json);;All Files (*)"
+
 # Example Utility Function:
 # def format_time_ms(milliseconds):
 #     """Formats milliseconds into MM:SS or HH:MM:SS string."""